@@ -3,17 +3,27 @@
 Debug script to analyze ProductHunt HTML structure.
 """
 
-import requests
+import re
+import sys
+from pathlib import Path
 from bs4 import BeautifulSoup
 import urllib3
 
+# Share the scrapers' session setup from src/
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'src'))
+
+from http_session import create_session  # noqa: E402
+
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Text nodes made only of a positive number, e.g. vote counts
+VOTE_RX = re.compile(rb'>\s*0*([1-9]\d*)\s*<')
+
+
 def analyze_producthunt_structure():
     """Analyze ProductHunt page structure to improve selectors."""
-    session = requests.Session()
-    session.headers.update({
+    session = create_session({
         'User-Agent': 'ProductHunt Daily Recap CLI Tool v1.0',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
     })
@@ -24,7 +34,7 @@ def analyze_producthunt_structure():
         response = session.get("https://www.producthunt.com/", timeout=30)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         print(f"✅ Page loaded successfully ({len(response.content)} bytes)")
         
@@ -46,9 +56,9 @@ def analyze_producthunt_structure():
             text = link.get_text(strip=True)[:50]
             print(f"   {i+1}. {href} -> '{text}'")
         
-        # Look for vote elements
-        vote_elements = soup.find_all(string=lambda x: x and x.strip().isdigit() if x else False)
-        print(f"\n📊 Potential vote numbers found: {len([v for v in vote_elements if int(v.strip()) > 0])}")
+        # Look for vote elements: positive numbers that are a tag's whole text
+        votes = VOTE_RX.findall(response.content)
+        print(f"\n📊 Potential vote numbers found: {len(votes)}")
         
         # Look for common class patterns
         all_divs = soup.find_all('div')
@@ -5,37 +5,176 @@ This module scrapes all categories and subcategories from ProductHunt
 and creates a comprehensive mapping between URL-style names and display names.
 """
 
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
+import os
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 import json
 import re
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
 import time
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 import logging
 
+from config import load_config
+from models import CategoryInfo, SubcategoryInfo
+from http_session import (
+    DEFAULT_BACKOFF_FACTOR, RETRY_STATUS_CODES, create_async_session, create_session, retry_after_seconds
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent category page requests
+MAX_CONCURRENT_REQUESTS = 16
+
+# On-disk caches for fetched pages, reused across runs during development
+HTTP_CACHE_NAME = '.cache/producthunt-categories'
+ASYNC_HTTP_CACHE_NAME = '.cache/producthunt-categories-async'
+
+# Politeness budget shared by all concurrent requests
+MAX_REQUESTS_PER_SECOND = 5
+
+# Category links appear early in the page, so bodies are capped at this size
+MAX_PAGE_BYTES = 512 * 1024
+
+# Patterns used to turn display names into URL-style names
+_NON_WORD = re.compile(r'[^\w\s-]')
+_WS = re.compile(r'\s+')
+_MULTI_HY = re.compile(r'-+')
+
+# CSS selector for anchors pointing at category pages
+CATEGORY_LINK_SELECTOR = 'a[href*="/categories/"]'
+
+# Compiled XPath queries for category detail pages
+_CATEGORY_LINKS_XPATH = etree.XPath('//a[contains(@href, "/categories/")]')
+_META_DESCRIPTION_XPATH = etree.XPath('//meta[@name="description"]/@content')
+_DESCRIPTION_XPATHS = (
+    etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " category-description ")]'),
+    etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " description ")]'),
+    etree.XPath('//p'),
+)
+
+# Parse-time filter that keeps only anchors pointing at category pages
+CATEGORY_LINK_STRAINER = SoupStrainer('a', href=re.compile(r'/categories/'))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_category_name(name: str) -> str:
+    """Convert display name to URL-style name (cached)."""
+    # Convert to lowercase and replace spaces/special chars with hyphens
+    normalized = _NON_WORD.sub('', name.lower())
+    normalized = _WS.sub('-', normalized.strip())
+    normalized = _MULTI_HY.sub('-', normalized)  # Remove multiple hyphens
+    return normalized.strip('-')
+
+
+@lru_cache(maxsize=8192)
+def _extract_category_from_url(url: str) -> str:
+    """Extract category name from URL (cached)."""
+    # Remove any query parameters or fragments
+    path = url.split('#', 1)[0].split('?', 1)[0]
+    _, sep, category = path.rpartition('/categories/')
+    return category if sep else ""
+
+
+def _element_text(element) -> str:
+    """Return an element's text with whitespace collapsed."""
+    return ' '.join(element.text_content().split())
+
+
+def _parse_category_page(html_bytes: bytes, base_url: str, url_name: str) -> Dict:
+    """Extract subcategories and description from a category page body.
+    
+    Defined at module level so it can run in a worker process. The page is
+    parsed with lxml.html and queried with XPath, without building a
+    BeautifulSoup tree.
+    
+    Args:
+        html_bytes: Raw HTML of the category page
+        base_url: Site root used to resolve relative links
+        url_name: URL-style name of the category the page belongs to
+        
+    Returns:
+        Dictionary with 'subcategories' and 'description' keys
+    """
+    if not html_bytes.strip():
+        return {'subcategories': [], 'description': ""}
+    
+    tree = lxml.html.document_fromstring(html_bytes)
+    
+    # Look for subcategories or related categories
+    subcategories = []
+    seen_url_names = set()
+    
+    for link in _CATEGORY_LINKS_XPATH(tree):
+        href = link.get('href', '')
+        subcat_url_name = _extract_category_from_url(href)
+        if (subcat_url_name and subcat_url_name != url_name
+                and subcat_url_name not in seen_url_names):
+            display_name = _element_text(link)
+            if display_name:
+                seen_url_names.add(subcat_url_name)
+                subcategories.append(SubcategoryInfo(
+                    display_name=display_name,
+                    url_name=subcat_url_name,
+                    url=urljoin(base_url, href)
+                ))
+    
+    # Get category description if available
+    # The meta description is nearly always present, so check it first
+    meta_content = _META_DESCRIPTION_XPATH(tree)
+    description = meta_content[0] if meta_content else ""
+    if not description:
+        for xpath in _DESCRIPTION_XPATHS:
+            elements = xpath(tree)
+            if elements:
+                description = _element_text(elements[0])
+                if description:
+                    break
+    
+    return {
+        'subcategories': subcategories,
+        'description': description[:500] if description else ""
+    }
+
+
 class ProductHuntCategoryScraper:
     """Scraper for ProductHunt categories and subcategories."""
     
-    def __init__(self):
+    def __init__(self, max_retries: int = 3):
+        """Initialize the scraper.
+        
+        Args:
+            max_retries: Maximum number of retries for failed requests
+        """
+        self.max_retries = max_retries
         self.base_url = "https://www.producthunt.com"
         self.categories_url = f"{self.base_url}/categories"
-        self.session = requests.Session()
         
-        # Set headers to mimic a real browser
-        self.session.headers.update({
+        # Pooled session with headers that mimic a real browser
+        self.session = create_session({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip, deflate, br',
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
-        })
+        }, max_retries=max_retries, cache_name=HTTP_CACHE_NAME)
         
         # Store for categories
         self.categories = {}
@@ -43,137 +182,143 @@ class ProductHuntCategoryScraper:
         
     def extract_category_from_url(self, url: str) -> str:
         """Extract category name from URL."""
-        parsed = urlparse(url)
-        if '/categories/' in parsed.path:
-            category = parsed.path.split('/categories/')[-1]
-            # Remove any query parameters or fragments
-            return category.split('?')[0].split('#')[0]
-        return ""
+        return _extract_category_from_url(url)
     
     def normalize_category_name(self, name: str) -> str:
         """Convert display name to URL-style name."""
-        # Convert to lowercase and replace spaces/special chars with hyphens
-        normalized = re.sub(r'[^\w\s-]', '', name.lower())
-        normalized = re.sub(r'\s+', '-', normalized.strip())
-        normalized = re.sub(r'-+', '-', normalized)  # Remove multiple hyphens
-        return normalized.strip('-')
+        return _normalize_category_name(name)
     
-    def get_page_content(self, url: str) -> BeautifulSoup:
-        """Get page content with error handling."""
+    def get_page_body(self, url: str, max_bytes: Optional[int] = MAX_PAGE_BYTES) -> Optional[bytes]:
+        """Get a page body with error handling.
+        
+        Only the first max_bytes of the (decoded) body are read; pass None
+        to read the full document.
+        """
         try:
-            logger.info(f"Fetching: {url}")
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            # Add small delay to be respectful
-            time.sleep(1)
+            logger.info("Fetching: %s", url)
+            with self.session.get(url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                if max_bytes is None:
+                    body = response.content
+                else:
+                    body = response.raw.read(max_bytes, decode_content=True)
             
-            return BeautifulSoup(response.content, 'html.parser')
+            return body
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
     
-    def scrape_main_categories(self) -> Dict[str, Dict]:
+    def get_page_content(self, url: str, max_bytes: Optional[int] = MAX_PAGE_BYTES,
+                         parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Get parsed page content with error handling.
+        
+        parse_only restricts which tags are built into the tree.
+        """
+        body = self.get_page_body(url, max_bytes)
+        if body is None:
+            return None
+        return BeautifulSoup(body, 'lxml', parse_only=parse_only)
+    
+    def scrape_main_categories(self) -> Dict[str, CategoryInfo]:
         """Scrape main categories from the categories page."""
-        soup = self.get_page_content(self.categories_url)
+        soup = self.get_page_content(self.categories_url, parse_only=CATEGORY_LINK_STRAINER)
         if not soup:
             return {}
         
         categories = {}
         
-        # Look for category links - ProductHunt uses various structures
-        category_links = soup.find_all('a', href=lambda x: x and '/categories/' in x)
-        
-        # Also look for section headers that might contain category names
-        sections = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        
-        # Extract from links
-        for link in category_links:
+        # A single selector pass finds every category anchor on the page
+        for link in soup.select(CATEGORY_LINK_SELECTOR):
             href = link.get('href', '')
-            if '/categories/' in href and href != '/categories':
-                category_url_name = self.extract_category_from_url(href)
-                if category_url_name:
-                    # Get display name from link text or nearby text
-                    display_name = link.get_text(strip=True)
-                    if display_name:
-                        categories[category_url_name] = {
-                            'display_name': display_name,
-                            'url_name': category_url_name,
-                            'url': urljoin(self.base_url, href),
-                            'type': 'main_category',
-                            'subcategories': []
-                        }
-        
-        # Also try to find categories from structured content
-        # Look for patterns like category grids or lists
-        content_sections = soup.find_all(['div', 'section'], class_=lambda x: x and any(
-            term in str(x).lower() for term in ['category', 'grid', 'list', 'section']
-        ))
-        
-        for section in content_sections:
-            links = section.find_all('a', href=lambda x: x and '/categories/' in x)
-            for link in links:
-                href = link.get('href', '')
-                category_url_name = self.extract_category_from_url(href)
-                if category_url_name and category_url_name not in categories:
-                    display_name = link.get_text(strip=True)
-                    if display_name:
-                        categories[category_url_name] = {
-                            'display_name': display_name,
-                            'url_name': category_url_name,
-                            'url': urljoin(self.base_url, href),
-                            'type': 'main_category',
-                            'subcategories': []
-                        }
+            category_url_name = self.extract_category_from_url(href)
+            if category_url_name:
+                # Get display name from link text or nearby text
+                display_name = link.get_text(strip=True)
+                if display_name:
+                    categories[category_url_name] = CategoryInfo(
+                        display_name=display_name,
+                        url_name=category_url_name,
+                        url=urljoin(self.base_url, href)
+                    )
         
         logger.info(f"Found {len(categories)} main categories")
         return categories
     
-    def scrape_category_details(self, category_info: Dict) -> Dict:
-        """Scrape detailed information from a category page."""
-        soup = self.get_page_content(category_info['url'])
-        if not soup:
-            return category_info
-        
-        # Look for subcategories or related categories
-        subcategory_links = soup.find_all('a', href=lambda x: x and '/categories/' in x)
-        subcategories = []
-        
-        for link in subcategory_links:
-            href = link.get('href', '')
-            subcat_url_name = self.extract_category_from_url(href)
-            if subcat_url_name and subcat_url_name != category_info['url_name']:
-                display_name = link.get_text(strip=True)
-                if display_name:
-                    subcategories.append({
-                        'display_name': display_name,
-                        'url_name': subcat_url_name,
-                        'url': urljoin(self.base_url, href)
-                    })
+    async def _fetch(self, url: str, session: aiohttp.ClientSession,
+                     sem: asyncio.Semaphore, limiter: AsyncLimiter) -> bytes:
+        """Fetch a page body.
         
-        # Get category description if available
-        description_selectors = [
-            'meta[name="description"]',
-            '.category-description',
-            '.description',
-            'p'
-        ]
+        The semaphore bounds how many requests are in flight, the limiter
+        bounds how many start per second. Retries follow the sync session's
+        policy: one attempt plus max_retries retries of rate-limited and
+        transient server errors (RETRY_STATUS_CODES), after the server's
+        Retry-After delay when it gives one, and of connection errors and
+        timeouts, with exponential backoff.
+        """
+        async with sem:
+            for attempt in range(self.max_retries + 1):
+                delay = DEFAULT_BACKOFF_FACTOR * (2 ** attempt)
+                try:
+                    async with limiter:
+                        logger.info("Fetching: %s", url)
+                        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                            if response.status in RETRY_STATUS_CODES and attempt < self.max_retries:
+                                delay = retry_after_seconds(response.headers.get('Retry-After'), default=delay)
+                                logger.warning("HTTP %s on %s, retrying in %.1fs", response.status, url, delay)
+                            else:
+                                response.raise_for_status()
+                                return await self._read_capped(response)
+                
+                except aiohttp.ClientResponseError:
+                    raise
+                
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if attempt == self.max_retries:
+                        raise
+                    logger.warning("Request to %s failed (%s), retrying in %.1fs", url, e, delay)
+                
+                await asyncio.sleep(delay)
+    
+    async def _read_capped(self, response: aiohttp.ClientResponse) -> bytes:
+        """Read at most MAX_PAGE_BYTES of a response body."""
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_PAGE_BYTES:
+                break
+        return b''.join(chunks)[:MAX_PAGE_BYTES]
+    
+    async def _fetch_all(self, urls: List[str]) -> List:
+        """Fetch several pages concurrently.
         
-        description = ""
-        for selector in description_selectors:
-            desc_element = soup.select_one(selector)
-            if desc_element:
-                if selector.startswith('meta'):
-                    description = desc_element.get('content', '')
-                else:
-                    description = desc_element.get_text(strip=True)
-                if description:
-                    break
+        Returns one entry per URL, in order: the page body, or the
+        exception raised while fetching it.
+        """
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        limiter = AsyncLimiter(MAX_REQUESTS_PER_SECOND, 1)
+        async with create_async_session(dict(self.session.headers), ASYNC_HTTP_CACHE_NAME) as session:
+            tasks = [self._fetch(url, session, sem, limiter) for url in urls]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def scrape_category_details(self, category_info: CategoryInfo) -> CategoryInfo:
+        """Scrape detailed information from a category page."""
+        body = self.get_page_body(category_info.url)
+        if body is None:
+            return category_info
         
-        category_info['description'] = description[:500] if description else ""
-        category_info['subcategories'] = subcategories
+        details = _parse_category_page(body, self.base_url, category_info.url_name)
+        return self._apply_category_details(category_info, details)
+    
+    def _apply_category_details(self, category_info: CategoryInfo, details: Dict) -> CategoryInfo:
+        """Merge parsed page details into a category entry."""
+        category_info.description = details['description']
+        category_info.subcategories = details['subcategories']
         
-        logger.info(f"Scraped details for {category_info['display_name']}: {len(subcategories)} subcategories")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Scraped details for %s: %d subcategories",
+                        category_info.display_name, len(details['subcategories']))
         return category_info
     
     def discover_additional_categories(self) -> Set[str]:
@@ -195,7 +340,7 @@ class ProductHuntCategoryScraper:
         
         return additional_urls
     
-    def create_comprehensive_mapping(self) -> Dict:
+    def create_comprehensive_mapping(self) -> Dict[str, CategoryInfo]:
         """Create comprehensive category mapping."""
         # Start with main categories
         categories = self.scrape_main_categories()
@@ -230,50 +375,66 @@ class ProductHuntCategoryScraper:
         # Add known mappings to categories
         for url_name, display_name in known_mappings.items():
             if url_name not in categories:
-                categories[url_name] = {
-                    'display_name': display_name,
-                    'url_name': url_name,
-                    'url': f"{self.base_url}/categories/{url_name}",
-                    'type': 'main_category',
-                    'subcategories': [],
-                    'description': f"Category for {display_name} products"
-                }
+                categories[url_name] = CategoryInfo(
+                    display_name=display_name,
+                    url_name=url_name,
+                    url=f"{self.base_url}/categories/{url_name}",
+                    description=f"Category for {display_name} products"
+                )
+        
+        # Fetch all category pages concurrently, then parse them here
+        items = list(categories.items())
+        bodies = asyncio.run(self._fetch_all([info.url for _, info in items]))
         
-        # Try to scrape details for each category
+        # Parse the fetched pages across CPU cores, with no more workers
+        # than pages
         detailed_categories = {}
-        for url_name, category_info in categories.items():
-            try:
-                detailed_info = self.scrape_category_details(category_info)
-                detailed_categories[url_name] = detailed_info
-            except Exception as e:
-                logger.error(f"Error scraping details for {url_name}: {e}")
-                detailed_categories[url_name] = category_info
+        workers = max(1, min(os.cpu_count() or 1, len(bodies)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for (url_name, category_info), body in zip(items, bodies):
+                if isinstance(body, BaseException):
+                    logger.error(f"Error fetching {category_info.url}: {body}")
+                    detailed_categories[url_name] = category_info
+                    continue
+                future = pool.submit(_parse_category_page, body, self.base_url, url_name)
+                futures[future] = url_name
+            
+            for future in as_completed(futures):
+                url_name = futures[future]
+                category_info = categories[url_name]
+                try:
+                    detailed_categories[url_name] = self._apply_category_details(category_info, future.result())
+                except Exception as e:
+                    logger.error(f"Error scraping details for {url_name}: {e}")
+                    detailed_categories[url_name] = category_info
         
-        return detailed_categories
+        # Keep the discovery order of the categories
+        return {url_name: detailed_categories[url_name] for url_name in categories}
     
-    def create_reverse_mapping(self, categories: Dict) -> Dict:
+    def create_reverse_mapping(self, categories: Dict[str, CategoryInfo]) -> Dict:
         """Create mapping from display names to URL names."""
-        reverse_mapping = {}
-        
-        for url_name, category_info in categories.items():
-            display_name = category_info['display_name']
-            reverse_mapping[display_name.lower()] = url_name
-            
-            # Also add variations
-            normalized = self.normalize_category_name(display_name)
-            if normalized != url_name:
-                reverse_mapping[normalized] = url_name
-            
-            # Add subcategories to reverse mapping
-            for subcat in category_info.get('subcategories', []):
-                sub_display = subcat['display_name']
-                sub_url = subcat['url_name']
-                reverse_mapping[sub_display.lower()] = sub_url
-                reverse_mapping[self.normalize_category_name(sub_display)] = sub_url
+        def pairs():
+            for url_name, category_info in categories.items():
+                display_name = category_info.display_name
+                yield display_name.lower(), url_name
+                
+                # Also add variations
+                normalized = self.normalize_category_name(display_name)
+                if normalized != url_name:
+                    yield normalized, url_name
+                
+                # Add subcategories to reverse mapping
+                for subcat in category_info.subcategories:
+                    sub_display = subcat.display_name
+                    sub_url = subcat.url_name
+                    yield sub_display.lower(), sub_url
+                    yield self.normalize_category_name(sub_display), sub_url
         
-        return reverse_mapping
+        # Later pairs win on duplicate keys, as with sequential assignment
+        return dict(pairs())
     
-    def save_categories_data(self, categories: Dict, output_file: str):
+    def save_categories_data(self, categories: Dict[str, CategoryInfo], output_file: str):
         """Save categories data to JSON file."""
         # Create comprehensive data structure
         categories_data = {
@@ -283,26 +444,30 @@ class ProductHuntCategoryScraper:
                 'source_url': self.categories_url,
                 'scraper_version': '1.0'
             },
-            'categories': categories,
+            'categories': {url_name: info.to_dict() for url_name, info in categories.items()},
             'url_to_display_mapping': {
-                url_name: info['display_name'] 
+                url_name: info.display_name
                 for url_name, info in categories.items()
             },
             'display_to_url_mapping': self.create_reverse_mapping(categories),
             'category_list': list(categories.keys()),
-            'display_names': [info['display_name'] for info in categories.values()]
+            'display_names': [info.display_name for info in categories.values()]
         }
         
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(categories_data, f, indent=2, ensure_ascii=False)
+        # Save to file, using orjson when it is installed
+        if orjson is not None:
+            Path(output_file).write_bytes(orjson.dumps(categories_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(categories_data, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Saved {len(categories)} categories to {output_file}")
         return categories_data
 
 def main():
     """Main function to run the category scraper."""
-    scraper = ProductHuntCategoryScraper()
+    config = load_config()
+    scraper = ProductHuntCategoryScraper(max_retries=config.max_retries)
     
     # Create output file path
     output_file = "data/producthunt_categories.json"
@@ -321,7 +486,7 @@ def main():
         print(f"Output file: {output_file}")
         print(f"\nSample categories:")
         for i, (url_name, info) in enumerate(list(categories.items())[:10]):
-            print(f"  {url_name} -> {info['display_name']}")
+            print(f"  {url_name} -> {info.display_name}")
             if i >= 9:
                 print(f"  ... and {len(categories) - 10} more")
                 break
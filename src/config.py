@@ -29,6 +29,7 @@ class Config:
     # Scraping settings
     scraping_delay: float = 1.0
     max_retries: int = 3
+    max_concurrency: int = 8
     user_agent: str = "ProductHunt Daily Recap CLI Tool v1.0"
     
     # Optional webhook for notifications
@@ -44,6 +45,9 @@ class Config:
         
         if self.scraping_delay < 0:
             raise ValueError("Scraping delay must be non-negative")
+        
+        if self.max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
 
 
 def load_config() -> Config:
@@ -65,6 +69,7 @@ def load_config() -> Config:
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             scraping_delay=float(os.getenv("SCRAPING_DELAY", "1.0")),
             max_retries=int(os.getenv("MAX_RETRIES", "3")),
+            max_concurrency=int(os.getenv("MAX_CONCURRENCY", "8")),
             user_agent=os.getenv("USER_AGENT", "ProductHunt Daily Recap CLI Tool v1.0"),
             webhook_url=os.getenv("WEBHOOK_URL")
         )
@@ -82,12 +87,10 @@ def load_dotenv():
     env_file = Path(".env")
     if env_file.exists():
         logger.debug("Loading environment variables from .env file")
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+        lines = (line.strip() for line in env_file.read_text().splitlines())
+        pairs = (line.split('=', 1) for line in lines
+                 if line and not line.startswith('#') and '=' in line)
+        os.environ.update({key.strip(): value.strip() for key, value in pairs})
 
 
 def validate_config(config: Config) -> None:
@@ -0,0 +1,152 @@
+"""
+HTTP session helpers shared by the ProductHunt scrapers.
+
+Builds requests sessions with a sized connection pool and a retry policy,
+so keep-alive connections are reused across requests. When requests-cache
+or aiohttp-client-cache is installed, sessions can also keep fetched
+pages in an on-disk SQLite cache across runs.
+"""
+
+import aiohttp
+import requests
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Optional
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    from aiohttp_client_cache import CachedSession as AsyncCachedSession
+    from aiohttp_client_cache.backends.sqlite import SQLiteBackend
+except ImportError:
+    AsyncCachedSession = None
+
+# Rate limiting and transient server errors worth retrying
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Base delay in seconds of the exponential backoff between retries
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+# Hosts with a pooled connection set; the scrapers only talk to a few
+DEFAULT_POOL_CONNECTIONS = 4
+
+# Default lifetime of cached responses, in seconds
+DEFAULT_CACHE_EXPIRE_AFTER = 3600
+
+# Cache lifetime meaning "never expire" for both cache libraries
+NEVER_EXPIRE = -1
+
+# requests-cache lifetime keeping a response but revalidating it with a
+# conditional request (ETag/Last-Modified) before every use. Not
+# supported by aiohttp-client-cache, where 0 disables caching instead.
+REVALIDATE = 0
+
+# aiohttp-client-cache lifetime meaning "do not cache"
+DO_NOT_CACHE = 0
+
+
+def retry_after_seconds(value: Optional[str], default: float = 1.0) -> float:
+    """Convert a Retry-After header (seconds or HTTP date) to a delay."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def create_session(headers: Optional[Dict[str, str]] = None, pool_size: int = 32,
+                   pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                   max_retries: int = 3, backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+                   cache_name: Optional[str] = None,
+                   expire_after: int = DEFAULT_CACHE_EXPIRE_AFTER,
+                   urls_expire_after: Optional[Dict[str, int]] = None) -> requests.Session:
+    """Create a requests session with a pooled, retrying adapter.
+
+    Args:
+        headers: Default headers sent with every request
+        pool_size: Number of connections kept alive per host
+        pool_connections: Number of per-host connection pools kept
+        max_retries: Maximum number of retries for failed requests
+        backoff_factor: Base delay in seconds for exponential backoff
+        cache_name: Path of the SQLite response cache; caching is skipped
+            when None or when requests-cache is not installed
+        expire_after: Lifetime of cached responses in seconds
+        urls_expire_after: Per-URL-pattern lifetimes overriding expire_after
+
+    Returns:
+        Configured requests.Session
+    """
+    if cache_name and requests_cache is not None:
+        Path(cache_name).parent.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            cache_name,
+            backend='sqlite',
+            expire_after=expire_after,
+            urls_expire_after=urls_expire_after,
+            allowable_codes=(200,)
+        )
+    else:
+        session = requests.Session()
+
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    if headers:
+        session.headers.update(headers)
+
+    return session
+
+
+def create_async_session(headers: Optional[Dict[str, str]] = None,
+                         cache_name: Optional[str] = None,
+                         expire_after: int = DEFAULT_CACHE_EXPIRE_AFTER,
+                         urls_expire_after: Optional[Dict[str, int]] = None,
+                         connector: Optional[aiohttp.BaseConnector] = None) -> aiohttp.ClientSession:
+    """Create an aiohttp session, cached on disk when possible.
+
+    Must be called from inside a running event loop.
+
+    Args:
+        headers: Default headers sent with every request
+        cache_name: Path of the SQLite response cache; caching is skipped
+            when None or when aiohttp-client-cache is not installed
+        expire_after: Lifetime of cached responses in seconds
+        urls_expire_after: Per-URL-pattern lifetimes overriding expire_after
+        connector: Optional connector to use instead of aiohttp's default
+
+    Returns:
+        aiohttp.ClientSession (or a cached subclass)
+    """
+    if cache_name and AsyncCachedSession is not None:
+        Path(cache_name).parent.mkdir(parents=True, exist_ok=True)
+        cache = SQLiteBackend(
+            cache_name,
+            expire_after=expire_after,
+            urls_expire_after=urls_expire_after,
+            allowed_codes=(200,)
+        )
+        return AsyncCachedSession(cache=cache, headers=headers, connector=connector)
+    return aiohttp.ClientSession(headers=headers, connector=connector)
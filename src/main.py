@@ -7,58 +7,154 @@ AI-powered analysis for entrepreneurs.
 """
 
 import click
+import functools
+import heapq
 import logging
+import re
 import sys
 import json
-from datetime import datetime
+import os
+from collections import defaultdict
+import datetime
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 
-from scraper import ProductHuntScraper
-from models import create_daily_report
-from config import load_config, validate_config
+# Setup logging; the log file is only attached by the scrape command
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FILE = 'producthunt-recap.log'
 
-# Setup logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('producthunt-recap.log')
-    ]
+    format=LOG_FORMAT,
+    handlers=[logging.StreamHandler(sys.stdout)]
 )
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Product fields read by the ranking display
+_RANKING_FIELDS = ('name', 'tagline', 'category', 'url', 'votes')
+
+# Market-intel data files, plain or zstd-compressed
+_DATA_FILE_SUFFIXES = ('.json', '.json.zst')
+
+# Longest tagline shown in the ranking, including the '...' suffix
+_TAGLINE_MAX = 60
+
+# Location of the scraped ProductHunt categories data
+_CATEGORIES_PATH = Path(__file__).resolve().parent.parent / "data" / "categories.json"
+
+# Patterns used by the category name fallback normalization
+_NON_WORD = re.compile(r'[^\w\s-]')
+_WS = re.compile(r'\s+')
+_DASHES = re.compile(r'-+')
+
+# ASCII fast path for the same normalization: whitespace becomes a dash and
+# characters other than word characters and dashes are dropped
+_ASCII_NORMALIZE = str.maketrans({
+    c: ('-' if c.isspace() else None)
+    for c in map(chr, range(128))
+    if c.isspace() or not (c.isalnum() or c in '_-')
+})
+
+
+def _open_data_file(path):
+    """Open a data file for binary reading, decompressing .zst files.
+
+    zstandard is only imported when a compressed file is opened.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Binary file object
+    """
+    if str(path).endswith('.zst'):
+        import zstandard
+        return zstandard.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def _read_bytes(path):
+    """Read the (decompressed) contents of a data file."""
+    with _open_data_file(path) as f:
+        return f.read()
+
+
+def _read_json(path):
+    """Read and decode a JSON file, using orjson when it is installed.
 
+    orjson is imported here rather than at module level to keep CLI startup
+    (and --help) fast. Its decode errors subclass json.JSONDecodeError.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        Decoded JSON data
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(_read_bytes(path))
+    return orjson.loads(_read_bytes(path))
+
+
+# Basic category mapping used when the categories file has not been scraped
+_FALLBACK_CATEGORIES_DATA = {
+    "display_to_url_mapping": {
+        "engineering & development": "engineering-development",
+        "developer tools": "engineering-development",
+        "design & creative": "design-creative",
+        "work & productivity": "work-productivity"
+    },
+    "url_to_display_mapping": {
+        "engineering-development": "Engineering & Development",
+        "design-creative": "Design & Creative",
+        "work-productivity": "Work & Productivity"
+    }
+}
+
+
+@functools.lru_cache(maxsize=1)
 def load_categories_data():
-    """Load ProductHunt categories data from JSON file."""
+    """Load ProductHunt categories data from JSON file.
+    
+    The file is read once per process; callers must not mutate the result.
+    """
     try:
-        categories_file = Path(__file__).parent.parent / "data" / "categories.json"
-        with open(categories_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _read_json(_CATEGORIES_PATH)
     except FileNotFoundError:
         logger.warning("Categories file not found. Using basic category mapping.")
-        return {
-            "display_to_url_mapping": {
-                "engineering & development": "engineering-development",
-                "developer tools": "engineering-development",
-                "design & creative": "design-creative",
-                "work & productivity": "work-productivity"
-            },
-            "url_to_display_mapping": {
-                "engineering-development": "Engineering & Development",
-                "design-creative": "Design & Creative",
-                "work-productivity": "Work & Productivity"
-            }
-        }
+        return _FALLBACK_CATEGORIES_DATA
     except Exception as e:
         logger.error(f"Error loading categories data: {e}")
         return {"display_to_url_mapping": {}, "url_to_display_mapping": {}}
 
 
+# Category mappings, populated from load_categories_data() on first use
+_DISPLAY_TO_URL = None
+_URL_TO_DISPLAY = None
+
+
+def _ensure_maps():
+    """Populate the module-level category mappings if not yet loaded."""
+    global _DISPLAY_TO_URL, _URL_TO_DISPLAY
+    if _DISPLAY_TO_URL is None:
+        categories_data = load_categories_data()
+        _DISPLAY_TO_URL = categories_data.get("display_to_url_mapping", {})
+        _URL_TO_DISPLAY = categories_data.get("url_to_display_mapping", {})
+
+
+@functools.lru_cache(maxsize=256)
 def normalize_category_name(category_name):
     """Convert category names between display format and URL format.
     
+    Results are memoized; the set of distinct category names is small.
+    
     Args:
         category_name: Category name in either format
         
@@ -68,101 +164,283 @@ def normalize_category_name(category_name):
     if not category_name:
         return None
     
-    categories_data = load_categories_data()
+    _ensure_maps()
     category_lower = category_name.lower().strip()
     
     # Check if it's already a valid URL-style category
-    if category_lower in categories_data.get("url_to_display_mapping", {}):
+    if category_lower in _URL_TO_DISPLAY:
         return category_lower
     
     # Check display to URL mapping
-    if category_lower in categories_data.get("display_to_url_mapping", {}):
-        return categories_data["display_to_url_mapping"][category_lower]
+    url_name = _DISPLAY_TO_URL.get(category_lower)
+    if url_name is not None:
+        return url_name
     
     # Fallback: basic normalization for unknown categories
-    import re
-    normalized = re.sub(r'[^\w\s-]', '', category_lower)
-    normalized = re.sub(r'\s+', '-', normalized.strip())
-    normalized = re.sub(r'-+', '-', normalized)
+    if category_lower.isascii():
+        normalized = category_lower.translate(_ASCII_NORMALIZE)
+    else:
+        normalized = _NON_WORD.sub('', category_lower)
+        normalized = _WS.sub('-', normalized.strip())
+    normalized = _DASHES.sub('-', normalized)
     return normalized.strip('-')
 
 
 def get_category_display_name(category_url_name):
     """Get the display name for a category URL name."""
-    categories_data = load_categories_data()
-    return categories_data.get("url_to_display_mapping", {}).get(category_url_name, category_url_name)
+    _ensure_maps()
+    return _URL_TO_DISPLAY.get(category_url_name, category_url_name)
 
 
-def find_products_by_category(products_data, category_filter):
+def index_products_by_category(products_data):
+    """Group products by normalized category name.
+    
+    Each distinct category is normalized once, so repeated category lookups
+    cost a dict access instead of a scan over all products.
+    
+    Args:
+        products_data: List of product dictionaries
+        
+    Returns:
+        defaultdict mapping normalized category names to product lists
+    """
+    normalized_names = {}
+    products_by_category = defaultdict(list)
+    for product in products_data:
+        product_category = product.get('category', '')
+        if product_category not in normalized_names:
+            normalized_names[product_category] = normalize_category_name(product_category)
+        products_by_category[normalized_names[product_category]].append(product)
+    
+    return products_by_category
+
+
+def find_products_by_category(products_data, category_filter, products_by_category=None):
     """Find products matching a category filter.
     
     Args:
         products_data: List of product dictionaries
         category_filter: Category name in any supported format
+        products_by_category: Optional index built by index_products_by_category;
+            built from products_data when omitted
         
     Returns:
         List of matching products
     """
     if not category_filter:
         return products_data
+    if not products_data:
+        return []
     
-    # Normalize the filter
+    # A filter that normalizes to nothing (e.g. only punctuation) matches
+    # no category
     normalized_filter = normalize_category_name(category_filter)
+    if not normalized_filter:
+        return []
     
-    # Find matching products
-    filtered_products = []
-    for product in products_data:
-        product_category = product.get('category', '').lower()
-        normalized_product_category = normalize_category_name(product_category)
+    if products_by_category is None:
+        products_by_category = index_products_by_category(products_data)
+    
+    return products_by_category.get(normalized_filter, [])
+
+
+def _load_products(path, fields):
+    """Load the product list of a market-intel file, keeping only some fields.
+    
+    When pysimdjson is installed the document is parsed lazily and only the
+    requested fields of each product are converted to Python objects;
+    otherwise the whole file is decoded with _read_json.
+    
+    Args:
+        path: Path of the market-intel JSON file
+        fields: Product keys the caller reads
+        
+    Returns:
+        List of product dictionaries
+        
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    try:
+        import simdjson
+    except ImportError:
+        return _read_json(path).get('products', [])
+    
+    try:
+        data = simdjson.Parser().parse(_read_bytes(path))
+    except (ValueError, RuntimeError) as e:
+        raise json.JSONDecodeError(str(e), str(path), 0) from e
+    
+    return [
+        {field: product[field] for field in fields if field in product}
+        for product in data.get('products', [])
+    ]
+
+
+def _iter_product_categories(path):
+    """Yield the category of each product in a market-intel file.
+    
+    When ijson is installed the file is streamed one product at a time, so
+    memory use does not grow with the file size; otherwise the products are
+    loaded with _load_products.
+    
+    Args:
+        path: Path of the market-intel JSON file
+        
+    Yields:
+        Category name of each product ('Unknown' when missing)
+        
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    try:
+        import ijson
+    except ImportError:
+        for product in _load_products(path, ('category',)):
+            yield product.get('category', 'Unknown')
+        return
+    
+    with _open_data_file(path) as f:
+        try:
+            for product in ijson.items(f, 'products.item'):
+                yield product.get('category', 'Unknown')
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), str(path), 0) from e
+
+
+def _find_data_file(data_path, target_date):
+    """Find the market-intel file of a date, plain or zstd-compressed.
+    
+    Args:
+        data_path: Directory holding the data files
+        target_date: Date in YYYY-MM-DD format
         
-        if normalized_product_category == normalized_filter:
-            filtered_products.append(product)
+    Returns:
+        Path of the data file, or None if there is none
+    """
+    for suffix in _DATA_FILE_SUFFIXES:
+        data_filepath = data_path / f"market-intel-{target_date}{suffix}"
+        if data_filepath.exists():
+            return data_filepath
+    return None
+
+
+def _list_data_files(data_path):
+    """List market-intel data file names in a directory, sorted by name.
     
-    return filtered_products
+    File names embed the YYYY-MM-DD date, so name order is chronological.
+    
+    Args:
+        data_path: Directory to scan
+        
+    Returns:
+        Sorted tuple of file names; empty if the directory does not exist
+    """
+    try:
+        with os.scandir(data_path) as entries:
+            return tuple(sorted(
+                entry.name for entry in entries
+                if entry.name.startswith('market-intel-') and entry.name.endswith(_DATA_FILE_SUFFIXES)
+            ))
+    except OSError:
+        return ()
+
+
+def _distinct_categories(products_data):
+    """Return the sorted distinct categories of a product list.
+    
+    Only called on the paths that print the category list, so the set is
+    built lazily and at most once per command.
+    """
+    return sorted({p.get('category', 'Unknown') for p in products_data})
+
 
+def _shorten(text, limit=_TAGLINE_MAX):
+    """Truncate text to limit characters, ending with '...' when cut."""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
 
-def display_product_ranking(products_data, title="Product Ranking (by votes)", category_filter=None):
+
+@dataclass(**_DATACLASS_SLOTS)
+class _Product:
+    """Fields of a product shown in a ranking."""
+    name: str
+    tagline: str
+    category: str
+    url: str
+    votes: int
+    
+    @classmethod
+    def from_dict(cls, product):
+        """Build from a product dictionary, filling in display placeholders."""
+        return cls(
+            name=product.get('name', 'Unknown Product'),
+            tagline=product.get('tagline', 'No tagline available'),
+            category=product.get('category', 'Uncategorized'),
+            url=product.get('url', 'No URL available'),
+            votes=int(product.get('votes', 0) or 0)
+        )
+
+
+def display_product_ranking(products_data, title="Product Ranking (by votes)", category_filter=None,
+                            products_by_category=None, limit=None):
     """Display products ranked by votes in descending order.
     
     Args:
         products_data: List of product dictionaries
         title: Title to display for the ranking
         category_filter: Optional category to filter by (supports both display names and URL-style names)
+        products_by_category: Optional index of products_data built by
+            index_products_by_category, reused for the category lookup
+        limit: Optional maximum number of products to display
+    
+    Returns:
+        Tuple of (number of products ranked, total votes of those products);
+        both cover every ranked product even when limit cuts the display
     """
     # Filter by category if specified
     if category_filter:
-        filtered_products = find_products_by_category(products_data, category_filter)
+        filtered_products = find_products_by_category(products_data, category_filter, products_by_category)
         if not filtered_products:
-            available_categories = sorted(set(p.get('category', 'Unknown') for p in products_data))
+            available_categories = _distinct_categories(products_data)
             click.echo(f"❌ No products found in category '{category_filter}'")
             click.echo(f"📁 Available categories: {', '.join(available_categories)}")
             click.echo(f"💡 Tip: You can also use URL-style names like 'engineering-development' for 'Developer Tools'")
-            return
+            return 0, 0
         products_data = filtered_products
         title = f"Product Ranking in '{category_filter}' (by votes)"
     
-    click.echo(f"\n🏆 {title}:")
-    click.echo("=" * 60)
+    # Collect the ranking output and write it with a single echo
+    lines = [f"\n🏆 {title}:", "=" * 60]
+    
+    # Extract the displayed fields once, totalling votes as we go; missing
+    # or null counts rank as 0
+    ranked_products = []
+    total_votes = 0
+    for product in products_data:
+        record = _Product.from_dict(product)
+        total_votes += record.votes
+        ranked_products.append(record)
     
-    # Sort products by votes in descending order
-    sorted_products = sorted(products_data, key=lambda x: x.get('votes', 0), reverse=True)
+    # Sort by votes in descending order, or select only the top entries
+    # when the display is limited
+    if limit is None:
+        ranked_products.sort(key=attrgetter('votes'), reverse=True)
+        displayed_products = ranked_products
+    else:
+        displayed_products = heapq.nlargest(limit, ranked_products, key=attrgetter('votes'))
     
-    for i, product in enumerate(sorted_products, 1):
-        votes = product.get('votes', 0)
-        name = product.get('name', 'Unknown Product')
-        tagline = product.get('tagline', 'No tagline available')
-        category = product.get('category', 'Uncategorized')
-        url = product.get('url', 'No URL available')
-        
-        # Truncate tagline if too long
-        if len(tagline) > 60:
-            tagline = tagline[:57] + "..."
-        
-        click.echo(f"{i:2}. 🗳️  {votes:3} votes | {name}")
-        click.echo(f"    📝 {tagline}")
-        click.echo(f"    🏷️  {category}")
-        click.echo(f"    🔗 {url}")
-        click.echo()
+    for i, product in enumerate(displayed_products, 1):
+        lines.extend((
+            f"{i:2}. 🗳️  {product.votes:3} votes | {product.name}",
+            f"    📝 {_shorten(product.tagline)}",
+            f"    🏷️  {product.category}",
+            f"    🔗 {product.url}",
+            ""
+        ))
+    
+    click.echo("\n".join(lines))
+    
+    return len(ranked_products), total_votes
 
 
 @click.group()
@@ -171,50 +449,46 @@ def cli():
     pass
 
 
-@cli.command()
+@cli.command(name="file-categories")
 @click.option('--date', type=str, default=None, 
               help='Specific date to list categories for (YYYY-MM-DD format)')
 @click.option('--data-dir', type=click.Path(), default='./data', 
               help='Directory to read data files from')
-def categories(date, data_dir):
+def file_categories(date, data_dir):
     """List all available product categories from existing data files."""
     
     # Parse date
-    target_date = datetime.now().strftime('%Y-%m-%d') if date is None else date
+    target_date = datetime.date.today().isoformat() if date is None else date
     
     # Look for data file
     data_path = Path(data_dir)
     data_filename = f"market-intel-{target_date}.json"
-    data_filepath = data_path / data_filename
+    data_filepath = _find_data_file(data_path, target_date)
     
-    if not data_filepath.exists():
+    if data_filepath is None:
         click.echo(f"❌ No data file found for {target_date}")
-        click.echo(f"   Looking for: {data_filepath}")
+        click.echo(f"   Looking for: {data_path / data_filename}")
         
         # List available files
-        available_files = list(data_path.glob("market-intel-*.json"))
+        available_files = _list_data_files(data_path)
         if available_files:
             click.echo("\n📁 Available data files:")
-            for file in sorted(available_files):
-                click.echo(f"   - {file.name}")
+            for file_name in available_files:
+                click.echo(f"   - {file_name}")
         
         sys.exit(1)
     
     try:
-        # Load and analyze data
-        with open(data_filepath, 'r') as f:
-            data = json.load(f)
-        
-        products = data.get('products', [])
-        if not products:
-            click.echo(f"❌ No products found in {data_filename}")
-            sys.exit(1)
-        
-        # Count products by category
+        # Count products by category while reading the data
         category_counts = {}
-        for product in products:
-            category = product.get('category', 'Unknown')
+        total_products = 0
+        for category in _iter_product_categories(data_filepath):
             category_counts[category] = category_counts.get(category, 0) + 1
+            total_products += 1
+        
+        if not total_products:
+            click.echo(f"❌ No products found in {data_filepath.name}")
+            sys.exit(1)
         
         click.echo(f"📅 ProductHunt Categories for {target_date}")
         click.echo("🏷️  Available Categories:")
@@ -227,7 +501,7 @@ def categories(date, data_dir):
             plural = "product" if count == 1 else "products"
             click.echo(f"{i:2}. {category:<20} ({count} {plural})")
         
-        click.echo(f"\n📊 Total: {len(sorted_categories)} categories, {len(products)} products")
+        click.echo(f"\n📊 Total: {len(sorted_categories)} categories, {total_products} products")
         
     except json.JSONDecodeError:
         click.echo(f"❌ Invalid JSON file: {data_filepath}")
@@ -244,61 +518,51 @@ def categories(date, data_dir):
               help='Directory to read data files from')
 @click.option('--category', type=str, default=None,
               help='Filter products by category using URL-style names (e.g., "engineering-development", "social-media") or display names ("Developer Tools")')
-def ranking(date, data_dir, category):
+@click.option('--top', type=click.IntRange(min=1), default=None,
+              help='Only show the N products with the most votes')
+def ranking(date, data_dir, category, top):
     """Display product ranking from existing data files."""
     
     # Parse date
-    target_date = datetime.now().strftime('%Y-%m-%d') if date is None else date
+    target_date = datetime.date.today().isoformat() if date is None else date
     
     # Look for data file
     data_path = Path(data_dir)
     data_filename = f"market-intel-{target_date}.json"
-    data_filepath = data_path / data_filename
+    data_filepath = _find_data_file(data_path, target_date)
     
-    if not data_filepath.exists():
+    if data_filepath is None:
         click.echo(f"❌ No data file found for {target_date}")
-        click.echo(f"   Looking for: {data_filepath}")
+        click.echo(f"   Looking for: {data_path / data_filename}")
         
         # List available files
-        available_files = list(data_path.glob("market-intel-*.json"))
+        available_files = _list_data_files(data_path)
         if available_files:
             click.echo("\n📁 Available data files:")
-            for file in sorted(available_files):
-                click.echo(f"   - {file.name}")
+            for file_name in available_files:
+                click.echo(f"   - {file_name}")
         
         sys.exit(1)
     
     try:
         # Load and display data
-        with open(data_filepath, 'r') as f:
-            data = json.load(f)
-        
-        products = data.get('products', [])
+        products = _load_products(data_filepath, _RANKING_FIELDS)
         if not products:
-            click.echo(f"❌ No products found in {data_filename}")
+            click.echo(f"❌ No products found in {data_filepath.name}")
             sys.exit(1)
         
         click.echo(f"📅 ProductHunt Ranking for {target_date}")
         
-        # Check if category filter will return results before displaying
-        if category:
-            filtered_products = find_products_by_category(products, category)
-            if not filtered_products:
-                available_categories = sorted(set(p.get('category', 'Unknown') for p in products))
-                click.echo(f"❌ No products found in category '{category}'")
-                click.echo(f"📁 Available categories: {', '.join(available_categories)}")
-                click.echo(f"💡 Tip: You can also use URL-style names like 'engineering-development' for 'Developer Tools'")
-                return
-        
-        display_product_ranking(products, category_filter=category)
+        # The ranking filters by category once and returns the totals used
+        # by the summary; nothing was ranked if the category had no match
+        products_by_category = index_products_by_category(products) if category else None
+        total_products, total_votes = display_product_ranking(
+            products, category_filter=category, products_by_category=products_by_category, limit=top
+        )
+        if not total_products:
+            return
         
         # Show summary
-        filtered_products = products
-        if category:
-            filtered_products = find_products_by_category(products, category)
-        
-        total_products = len(filtered_products)
-        total_votes = sum(p.get('votes', 0) for p in filtered_products)
         avg_votes = total_votes / total_products if total_products > 0 else 0
         
         summary_title = f"📊 Summary for '{category}' category:" if category else "📊 Summary:"
@@ -309,7 +573,7 @@ def ranking(date, data_dir, category):
         
         if not category:
             # Show available categories
-            available_categories = sorted(set(p.get('category', 'Unknown') for p in products))
+            available_categories = _distinct_categories(products)
             click.echo(f"   - Available Categories: {', '.join(available_categories)}")
         
     except json.JSONDecodeError:
@@ -320,6 +584,55 @@ def ranking(date, data_dir, category):
         sys.exit(1)
 
 
+def _save_daily_report(target_date, products_data, output_path, compress, category, ai_analysis, mode):
+    """Save the market report of one scraped day and print its summary and ranking.
+    
+    Args:
+        target_date: Scraped date in YYYY-MM-DD format
+        products_data: Products scraped for that date
+        output_path: Directory the report is written to
+        compress: Whether to save the report zstd-compressed
+        category: Optional category filter for the ranking
+        ai_analysis: Whether AI analysis was requested
+        mode: AI analysis depth mode
+    """
+    from models import create_daily_report
+    
+    if not products_data:
+        click.echo(f"⚠️  No products found for {target_date}")
+        logger.warning(f"No products found for date: {target_date}")
+        return
+    
+    click.echo(f"✅ Found {len(products_data)} products")
+    
+    # Create daily report
+    daily_report = create_daily_report(target_date, products_data)
+    
+    # TODO: Add AI analysis here when implemented
+    if ai_analysis:
+        click.echo(f"🤖 AI analysis would be performed here (mode: {mode})")
+        logger.info(f"AI analysis skipped - not yet implemented")
+    
+    # Save to file
+    output_filename = f"market-intel-{target_date}.json{'.zst' if compress else ''}"
+    output_filepath = output_path / output_filename
+    
+    daily_report.save_to_file(str(output_filepath))
+    
+    click.echo(f"💾 Report saved: {output_filepath}")
+    click.echo(f"📊 Market Summary:")
+    click.echo(f"   - Total Products: {daily_report.market_summary.total_products}")
+    click.echo(f"   - Top Categories: {', '.join(daily_report.market_summary.trending_categories)}")
+    
+    if daily_report.market_summary.top_product['name']:
+        click.echo(f"   - Top Product: {daily_report.market_summary.top_product['name']} ({daily_report.market_summary.top_product['votes']} votes)")
+    
+    # Always display product ranking (default behavior)
+    products_by_category = index_products_by_category(products_data) if category else None
+    display_product_ranking(products_data, category_filter=category,
+                            products_by_category=products_by_category)
+
+
 @cli.command(name="scrape")
 @click.option('--ai-analysis', is_flag=True, default=False, 
               help='Enable AI analysis of products and market trends')
@@ -335,13 +648,21 @@ def ranking(date, data_dir, category):
               help='Suppress output except errors')
 @click.option('--verbose', is_flag=True, default=False, 
               help='Enable verbose logging')
-def main(ai_analysis, mode, date, output_dir, category, quiet, verbose):
+@click.option('--compress', is_flag=True, default=False,
+              help='Save the report zstd-compressed (.json.zst, requires zstandard)')
+@click.option('--days', type=click.IntRange(min=1), default=1,
+              help='Number of consecutive days to scrape, ending at --date (fetched concurrently)')
+def main(ai_analysis, mode, date, output_dir, category, quiet, verbose, compress, days):
     """ProductHunt Daily Recap CLI Tool with AI Analysis.
     
     Scrapes ProductHunt daily products and optionally analyzes them
     with AI to provide market intelligence for entrepreneurs.
     """
     
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logging.getLogger().addHandler(file_handler)
+    
     # Configure logging based on flags
     if quiet:
         logging.getLogger().setLevel(logging.ERROR)
@@ -355,14 +676,30 @@ def main(ai_analysis, mode, date, output_dir, category, quiet, verbose):
         logger.info(f"Analysis Mode: {mode}")
     
     # Parse date
-    target_date = datetime.now().strftime('%Y-%m-%d') if date is None else date
+    target_date = datetime.date.today().isoformat() if date is None else date
     logger.info(f"Target Date: {target_date}")
     
+    # Dates to scrape, oldest first
+    if days == 1:
+        target_dates = [target_date]
+    else:
+        try:
+            end_date = datetime.date.fromisoformat(target_date)
+        except ValueError:
+            raise click.BadParameter(f"'{target_date}' is not a YYYY-MM-DD date", param_hint="'--date'")
+        target_dates = [(end_date - datetime.timedelta(days=offset)).isoformat()
+                        for offset in range(days - 1, -1, -1)]
+    
     # Ensure output directory exists
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     logger.info(f"Output Directory: {output_path.absolute()}")
     
+    # Scraping dependencies are imported here so that --help, ranking and
+    # categories start without loading them
+    from scraper import ProductHuntScraper
+    from config import load_config, validate_config
+    
     try:
         # Load configuration
         config = load_config()
@@ -371,13 +708,17 @@ def main(ai_analysis, mode, date, output_dir, category, quiet, verbose):
         # Initialize scraper
         scraper = ProductHuntScraper(
             delay=config.scraping_delay,
-            max_retries=config.max_retries
+            max_retries=config.max_retries,
+            max_concurrency=config.max_concurrency
         )
         
         # Start scraping
         logger.info("Starting ProductHunt scraping...")
         click.echo("🚀 ProductHunt Daily Recap CLI Tool")
-        click.echo(f"📅 Date: {target_date}")
+        if days == 1:
+            click.echo(f"📅 Date: {target_date}")
+        else:
+            click.echo(f"📅 Dates: {target_dates[0]} to {target_dates[-1]} ({days} days)")
         click.echo(f"🤖 AI Analysis: {'✅ Enabled' if ai_analysis else '❌ Disabled'}")
         
         if ai_analysis:
@@ -385,41 +726,18 @@ def main(ai_analysis, mode, date, output_dir, category, quiet, verbose):
         
         click.echo(f"📁 Output: {output_path.absolute()}")
         
-        # Scrape products
+        # Scrape products; several days are fetched concurrently
         click.echo("🔍 Scraping ProductHunt products...")
-        products_data = scraper.scrape_daily_products(target_date)
-        
-        if not products_data:
-            click.echo("⚠️  No products found for the specified date")
-            logger.warning(f"No products found for date: {target_date}")
-            return
-        
-        click.echo(f"✅ Found {len(products_data)} products")
-        
-        # Create daily report
-        daily_report = create_daily_report(target_date, products_data)
-        
-        # TODO: Add AI analysis here when implemented
-        if ai_analysis:
-            click.echo(f"🤖 AI analysis would be performed here (mode: {mode})")
-            logger.info(f"AI analysis skipped - not yet implemented")
-        
-        # Save to file
-        output_filename = f"market-intel-{target_date}.json"
-        output_filepath = output_path / output_filename
-        
-        daily_report.save_to_file(str(output_filepath))
-        
-        click.echo(f"💾 Report saved: {output_filepath}")
-        click.echo(f"📊 Market Summary:")
-        click.echo(f"   - Total Products: {daily_report.market_summary.total_products}")
-        click.echo(f"   - Top Categories: {', '.join(daily_report.market_summary.trending_categories)}")
-        
-        if daily_report.market_summary.top_product['name']:
-            click.echo(f"   - Top Product: {daily_report.market_summary.top_product['name']} ({daily_report.market_summary.top_product['votes']} votes)")
-        
-        # Always display product ranking (default behavior)
-        display_product_ranking(products_data, category_filter=category)
+        with scraper:
+            if days == 1:
+                products_by_date = {target_date: scraper.scrape_daily_products(target_date)}
+            else:
+                products_by_date = scraper.scrape_range(target_dates)
+        
+        for day, products_data in products_by_date.items():
+            if days > 1:
+                click.echo(f"\n📅 {day}")
+            _save_daily_report(day, products_data, output_path, compress, category, ai_analysis, mode)
         
         logger.info("ProductHunt scraping completed successfully")
         
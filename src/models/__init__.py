@@ -4,13 +4,32 @@ Data models for ProductHunt data structures.
 Defines the JSON schema and data validation for products and market data.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import List, Dict, Optional
 from datetime import datetime
+from operator import itemgetter
+from pathlib import Path
+import heapq
 import json
+import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# orjson options matching json.dumps(indent=2); non-string keys (e.g. in
+# AI analysis dicts) are converted to strings as json does
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+# Compression level for .zst reports; fast, and JSON still shrinks several-fold
+ZSTD_LEVEL = 3
+
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Product:
     """Data model for a ProductHunt product."""
     name: str
@@ -26,10 +45,21 @@ class Product:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "name": self.name,
+            "tagline": self.tagline,
+            "votes": self.votes,
+            "comments": self.comments,
+            "url": self.url,
+            "maker": self.maker,
+            "category": self.category,
+            "launched_at": self.launched_at,
+            "competitive_score": self.competitive_score,
+            "ai_analysis": self.ai_analysis
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MarketSummary:
     """Data model for market summary with AI analysis."""
     total_products: int
@@ -39,10 +69,15 @@ class MarketSummary:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "total_products": self.total_products,
+            "trending_categories": self.trending_categories,
+            "top_product": self.top_product,
+            "ai_market_analysis": self.ai_market_analysis
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DailyReport:
     """Complete daily report structure."""
     date: str
@@ -58,13 +93,54 @@ class DailyReport:
         }
     
     def to_json(self, indent: int = 2) -> str:
-        """Convert to JSON string."""
+        """Convert to JSON string.
+        
+        Uses orjson when it is installed and the indent is 2, the only
+        indentation orjson supports.
+        """
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self.to_dict(), option=_ORJSON_OPTIONS).decode('utf-8')
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
     
     def save_to_file(self, filepath: str) -> None:
-        """Save report to JSON file."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(self.to_json())
+        """Save report to JSON file, using orjson when it is installed.
+        
+        Paths ending in .zst are written zstd-compressed, which requires
+        the zstandard package.
+        """
+        if orjson is not None:
+            data = orjson.dumps(self.to_dict(), option=_ORJSON_OPTIONS)
+        else:
+            data = self.to_json().encode('utf-8')
+        
+        if str(filepath).endswith('.zst'):
+            import zstandard
+            data = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        
+        Path(filepath).write_bytes(data)
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class SubcategoryInfo:
+    """Data model for a subcategory linked from a category page."""
+    display_name: str
+    url_name: str
+    url: str
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class CategoryInfo:
+    """Data model for a ProductHunt category."""
+    display_name: str
+    url_name: str
+    url: str
+    type: str = 'main_category'
+    subcategories: List[SubcategoryInfo] = field(default_factory=list)
+    description: str = ""
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return asdict(self)
 
 
 def create_daily_report(date: str, products_data: List[Dict]) -> DailyReport:
@@ -77,24 +153,27 @@ def create_daily_report(date: str, products_data: List[Dict]) -> DailyReport:
     Returns:
         DailyReport instance
     """
-    # Convert raw data to Product objects
-    products = [Product(**product_data) for product_data in products_data]
+    # Convert raw data to Product objects, tallying categories and tracking
+    # the top product by votes in the same pass
+    products = []
+    category_counts = {}
+    top_product_obj = None
+    for product_data in products_data:
+        product = Product(**product_data)
+        products.append(product)
+        category_counts[product.category] = category_counts.get(product.category, 0) + 1
+        if top_product_obj is None or product.votes > top_product_obj.votes:
+            top_product_obj = product
     
     # Calculate market summary
     total_products = len(products)
     
     # Get trending categories (top 3 by frequency)
-    category_counts = {}
-    for product in products:
-        category = product.category
-        category_counts[category] = category_counts.get(category, 0) + 1
-    
-    trending_categories = sorted(category_counts.keys(), 
-                               key=lambda x: category_counts[x], 
-                               reverse=True)[:3]
+    trending_categories = [
+        category for category, _ in heapq.nlargest(3, category_counts.items(), key=itemgetter(1))
+    ]
     
-    # Find top product by votes
-    top_product_obj = max(products, key=lambda p: p.votes) if products else None
+    # Summarize the top product
     top_product = {
         "name": top_product_obj.name if top_product_obj else "",
         "votes": top_product_obj.votes if top_product_obj else 0,
@@ -4,44 +4,548 @@ ProductHunt scraper module.
 Handles web scraping of ProductHunt daily products with respectful rate limiting.
 """
 
-import time
+import asyncio
+import contextlib
+import functools
+import json
 import logging
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+import os
+import random
+import re
+import aiohttp
+import soupsieve
+from aiolimiter import AsyncLimiter
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import urllib3
 
+from http_session import (
+    DO_NOT_CACHE, NEVER_EXPIRE, RETRY_STATUS_CODES, REVALIDATE, create_async_session, create_session,
+    retry_after_seconds
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Disable SSL warnings for corporate networks
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# Today's products are on the front page, earlier days on time-travel pages
+FRONT_PAGE_URL = "https://www.producthunt.com/"
+TIME_TRAVEL_URL = "https://www.producthunt.com/time-travel/{}"
+
+# Default number of dates fetched concurrently by scrape_many
+MAX_CONCURRENT_REQUESTS = 8
+
+# Connection pool of the aiohttp session: total and per-host connection
+# limits, and how long resolved addresses are reused (seconds)
+CONNECTOR_LIMIT = 20
+CONNECTOR_LIMIT_PER_HOST = 8
+DNS_CACHE_TTL = 300
+
+# On-disk HTTP response cache, used when requests-cache/aiohttp-client-cache
+# are installed. Past days never change, so their time-travel pages never
+# expire. Everything else (today's front page) is revalidated on each run
+# by the sync session. The async cache cannot revalidate, so it does not
+# keep today's page at all: patterns match URL prefixes and the first
+# match wins, so the front page pattern covers what time-travel does not.
+HTTP_CACHE_NAME = '.cache/producthunt-daily'
+ASYNC_HTTP_CACHE_NAME = '.cache/producthunt-daily-async'
+CACHE_EXPIRE_AFTER = REVALIDATE
+URLS_EXPIRE_AFTER = {'www.producthunt.com/time-travel/*': NEVER_EXPIRE}
+ASYNC_URLS_EXPIRE_AFTER = {**URLS_EXPIRE_AFTER, 'www.producthunt.com/': DO_NOT_CACHE}
+
+# Product cards, matched in one CSS pass in document order
+POST_ITEM_SELECTOR = 'div[data-test*="post-item"], article[data-test*="post-item"]'
+_POST_ITEM_PATTERN = soupsieve.compile(POST_ITEM_SELECTOR)
+
+# ProductHunt serves UTF-8; passing it skips bs4's encoding detection
+PAGE_ENCODING = 'utf-8'
+
+# Class names of generic product cards, for pages without post-item cards
+_CARD_CLASS_RE = re.compile(r'product|post|item', re.IGNORECASE)
+
+# Keep only product cards, with their contents, while the page is parsed;
+# pages without them are parsed again keeping only the generic cards that
+# _parse_products falls back to
+POST_ITEM_STRAINER = SoupStrainer(['div', 'article'], attrs={'data-test': re.compile(r'post-item')})
+FALLBACK_CARD_STRAINER = SoupStrainer('div', class_=_CARD_CLASS_RE)
+
+# Maximum number of product cards parsed per page
+MAX_PRODUCTS = 20
+
+# CSS selectors tried in order for each product field
+NAME_SELECTORS = (
+    'h3', 'h2', '[data-test*="name"]', '.name', '.title',
+    'a[href*="/posts/"]', '[class*="name"]', '[class*="title"]'
+)
+TAGLINE_SELECTORS = (
+    '.tagline', '.description', '[data-test*="tagline"]',
+    'p', '.subtitle', '[class*="tagline"]', '[class*="description"]'
+)
+VOTES_SELECTORS = (
+    '[data-test*="vote"]', '.votes', '.vote-count', '.upvote',
+    '[class*="vote"]', '[class*="count"]'
+)
+COMMENTS_SELECTORS = (
+    '[data-test*="comment"]', '.comments', '.comment-count',
+    '[class*="comment"]', '[href*="comments"]'
+)
+MAKER_SELECTORS = (
+    '[data-test*="maker"]', '.maker', '.author', '.creator',
+    '[class*="maker"]', '[class*="author"]'
+)
+# Category is often harder to find
+CATEGORY_SELECTORS = (
+    '.category', '.tag', '[data-test*="category"]',
+    '[class*="category"]', '[class*="tag"]'
+)
+
+# Link to the product's post page
+_POST_LINK_PATTERN = soupsieve.compile('a[href*="/posts/"]')
+
+_DIGITS_RE = re.compile(r'\d+')
+
+# Next.js pages embed their Apollo cache as JSON in this script tag
+_NEXT_DATA_RE = re.compile(rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+# Headers sent with every ProductHunt request
+DEFAULT_HEADERS = {
+    'User-Agent': 'ProductHunt Daily Recap CLI Tool v1.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Realistic product names and taglines based on common ProductHunt patterns:
+# (name, tagline, votes range, comments range, maker, category)
+_MOCK_PRODUCTS = (
+    ("AI Productivity Suite",
+     "Boost your workflow with intelligent automation and smart insights",
+     (50, 300), (5, 45), "ProductivityAI", "Productivity"),
+    ("CodeReview AI",
+     "Automated code reviews with AI-powered suggestions and security checks",
+     (80, 250), (10, 35), "DevTools Pro", "Developer Tools"),
+    ("StartupMetrics Dashboard",
+     "Track KPIs, revenue, and growth metrics in one beautiful dashboard",
+     (120, 280), (15, 40), "MetricsLab", "Analytics"),
+    ("AI Content Generator",
+     "Create engaging content for social media, blogs, and marketing campaigns",
+     (90, 220), (8, 30), "ContentAI", "Marketing"),
+    ("Remote Team Sync",
+     "Keep distributed teams aligned with smart scheduling and collaboration tools",
+     (60, 180), (12, 25), "RemoteFirst", "Collaboration"),
+    ("Customer Feedback AI",
+     "Analyze customer sentiment and extract actionable insights from reviews",
+     (70, 200), (7, 28), "FeedbackLabs", "Customer Success"),
+    ("Expense Tracker Pro",
+     "Smart expense tracking with receipt scanning and budget forecasting",
+     (85, 160), (9, 22), "FinanceTools", "Finance"),
+    ("Design System Builder",
+     "Create and maintain consistent design systems across your product team",
+     (95, 240), (11, 33), "DesignOps", "Design Tools"),
+    ("API Security Scanner",
+     "Automated vulnerability scanning and security testing for REST APIs",
+     (110, 190), (13, 27), "SecureAPI", "Security"),
+    ("Social Media Scheduler",
+     "Plan, schedule, and analyze your social media presence across all platforms",
+     (75, 210), (6, 31), "SocialGrowth", "Social Media"),
+)
+
+# Mock products with their post URLs precomputed
+_MOCK_TEMPLATE = tuple(
+    entry + (f"https://producthunt.com/posts/{entry[0].lower().replace(' ', '-')}",)
+    for entry in _MOCK_PRODUCTS
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_selector_group(selectors: Tuple[str, ...]) -> Tuple[soupsieve.SoupSieve, Tuple[soupsieve.SoupSieve, ...]]:
+    """Compile a selector list into its union and the individual selectors.
+    
+    Args:
+        selectors: CSS selectors in order of priority
+        
+    Returns:
+        Tuple of (union pattern, per-selector patterns)
+    """
+    return soupsieve.compile(', '.join(selectors)), tuple(soupsieve.compile(s) for s in selectors)
+
+# Compile the field selectors at import: an invalid selector fails loudly
+# here instead of raising inside the per-product error handling, which
+# would silently turn every page into mock data
+for _selectors in (NAME_SELECTORS, TAGLINE_SELECTORS, VOTES_SELECTORS,
+                   COMMENTS_SELECTORS, MAKER_SELECTORS, CATEGORY_SELECTORS):
+    _compile_selector_group(_selectors)
+del _selectors
+
+
+def _parse_html(content: bytes) -> List[Dict]:
+    """Parse products from a page body.
+    
+    Reads the page's embedded Next.js data when it lists posts, and only
+    falls back to walking the HTML otherwise.
+    
+    Args:
+        content: Raw HTML of a ProductHunt page
+        
+    Returns:
+        List of product dictionaries
+    """
+    products = _parse_next_data(content)
+    if products:
+        return products
+    
+    # Parse HTML content with the C-backed lxml tree builder, building
+    # only the product cards
+    soup = BeautifulSoup(content, 'lxml', parse_only=POST_ITEM_STRAINER, from_encoding=PAGE_ENCODING)
+    if _POST_ITEM_PATTERN.select_one(soup) is None:
+        soup = BeautifulSoup(content, 'lxml', parse_only=FALLBACK_CARD_STRAINER, from_encoding=PAGE_ENCODING)
+    return _parse_products(soup)
+
+
+def _parse_next_data(content: bytes) -> Optional[List[Dict]]:
+    """Parse products from the __NEXT_DATA__ script of a page.
+    
+    Args:
+        content: Raw HTML of a ProductHunt page
+        
+    Returns:
+        List of product dictionaries, or None if the page has no usable
+        Next.js data
+    """
+    # A plain substring scan rules out most non-Next.js pages before the
+    # regex runs, and lets the regex start near the script tag. The payload
+    # usually sits at the end of the body, so the whole page is scanned.
+    marker = content.find(b'__NEXT_DATA__')
+    if marker == -1:
+        return None
+    match = _NEXT_DATA_RE.search(content, max(0, marker - len(b'<script id="')))
+    if not match:
+        return None
+    
+    try:
+        data = orjson.loads(match.group(1)) if orjson is not None else json.loads(match.group(1))
+        state = data['props']['pageProps']['apolloState']
+    except (ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Unusable __NEXT_DATA__ payload: {str(e)}")
+        return None
+    if not isinstance(state, dict):
+        return None
+    
+    launched_at = datetime.now().isoformat()
+    products = []
+    for entry in state.values():
+        if not isinstance(entry, dict) or entry.get('__typename') != 'Post' or not entry.get('name'):
+            continue
+        products.append(_product_from_post(entry, state, len(products), launched_at))
+        if len(products) == MAX_PRODUCTS:
+            break
+    
+    logger.info(f"Found {len(products)} products in __NEXT_DATA__")
+    return products
+
+
+def _resolve_ref(value, state: Dict):
+    """Follow an Apollo cache reference ({'__ref': key}) to its entry."""
+    if isinstance(value, dict) and '__ref' in value:
+        return state.get(value['__ref'])
+    return value
+
+
+def _first_related_name(value, state: Dict) -> Optional[str]:
+    """Get the name of the first entry of an Apollo list or connection.
+    
+    Args:
+        value: List of references, or a connection with edges/nodes
+        state: Apollo cache the references point into
+        
+    Returns:
+        Name of the first related entry or None
+    """
+    value = _resolve_ref(value, state)
+    if isinstance(value, dict):
+        value = value.get('edges') or value.get('nodes') or []
+    if not isinstance(value, list):
+        return None
+    for item in value:
+        item = _resolve_ref(item, state)
+        if isinstance(item, dict) and 'node' in item:
+            item = _resolve_ref(item['node'], state)
+        if isinstance(item, dict) and item.get('name'):
+            return item['name']
+    return None
+
+
+def _product_from_post(post: Dict, state: Dict, index: int, launched_at: str) -> Dict:
+    """Build a product dictionary from an Apollo Post entry.
+    
+    Args:
+        post: Post entry of the Apollo cache
+        state: Apollo cache the post's references point into
+        index: Product index for fallback values
+        launched_at: Timestamp used when the post has none
+        
+    Returns:
+        Dictionary with product data
+    """
+    slug = post.get('slug')
+    if post.get('url'):
+        url = post['url']
+    elif slug:
+        url = f"https://www.producthunt.com/posts/{slug}"
+    else:
+        url = f"https://www.producthunt.com/posts/product-{index + 1}"
+    
+    return {
+        'name': post['name'],
+        'tagline': post.get('tagline') or "No description available",
+        'votes': post.get('votesCount') or 0,
+        'comments': post.get('commentsCount') or 0,
+        'url': url,
+        'maker': _first_related_name(post.get('makers'), state) or "Unknown Maker",
+        'category': _first_related_name(post.get('topics'), state) or "General",
+        'launched_at': post.get('featuredAt') or post.get('createdAt') or launched_at
+    }
+
+
+def _parse_products(soup: BeautifulSoup) -> List[Dict]:
+    """Parse products from BeautifulSoup object.
+    
+    Args:
+        soup: BeautifulSoup parsed HTML
+        
+    Returns:
+        List of product dictionaries
+    """
+    products = []
+    
+    try:
+        # Look for product containers using common selectors
+        # ProductHunt uses data-test attributes and specific CSS classes
+        # Stop matching once MAX_PRODUCTS cards are found instead of
+        # walking the rest of the page
+        product_containers = _POST_ITEM_PATTERN.select(soup, limit=MAX_PRODUCTS)
+        
+        if not product_containers:
+            # Fallback: Look for common product card patterns
+            product_containers = soup.find_all('div', class_=_CARD_CLASS_RE, limit=MAX_PRODUCTS)
+        
+        logger.info(f"Found {len(product_containers)} potential product containers")
+        
+        # One timestamp for the whole page
+        launched_at = datetime.now().isoformat()
+        for i, container in enumerate(product_containers):
+            try:
+                product = _extract_product_data(container, i, launched_at)
+                if product and product.get('name') and not product['name'].startswith('Product '):
+                    # Only add if we got valid, non-generic data
+                    products.append(product)
+            except Exception as e:
+                logger.warning(f"Failed to parse product {i}: {str(e)}")
+                continue
+        
+        # If we couldn't parse any meaningful products, return realistic mock data
+        if not products:
+            logger.warning("No meaningful products extracted - using realistic mock data for development")
+            products = _get_mock_products()
+        
+    except Exception as e:
+        logger.error(f"Error parsing products: {str(e)}")
+        products = _get_mock_products()
+    
+    return products
+
+
+def _extract_product_data(container, index: int, launched_at: str) -> Dict:
+    """Extract product data from a container element.
+    
+    Args:
+        container: BeautifulSoup element containing product data
+        index: Product index for fallback naming
+        launched_at: Timestamp of the scrape, in ISO format
+        
+    Returns:
+        Dictionary with product data
+    """
+    product = {}
+    
+    # Extract product name
+    name = _find_text_by_selectors(container, NAME_SELECTORS)
+    product['name'] = name or f"Product {index + 1}"
+    
+    # Extract tagline/description
+    tagline = _find_text_by_selectors(container, TAGLINE_SELECTORS)
+    product['tagline'] = tagline or "No description available"
+    
+    # Extract votes (look for numbers)
+    votes_text = _find_text_by_selectors(container, VOTES_SELECTORS)
+    votes = _extract_number(votes_text) if votes_text else 0
+    product['votes'] = votes
+    
+    # Extract comments count
+    comments_text = _find_text_by_selectors(container, COMMENTS_SELECTORS)
+    comments = _extract_number(comments_text) if comments_text else 0
+    product['comments'] = comments
+    
+    # Extract product URL
+    url_element = _POST_LINK_PATTERN.select_one(container)
+    if url_element and url_element.get('href'):
+        href = url_element['href']
+        product['url'] = href if href.startswith('http') else f"https://www.producthunt.com{href}"
+    else:
+        product['url'] = f"https://www.producthunt.com/posts/product-{index + 1}"
+    
+    # Extract maker name
+    maker = _find_text_by_selectors(container, MAKER_SELECTORS)
+    product['maker'] = maker or "Unknown Maker"
+    
+    # Extract category
+    category = _find_text_by_selectors(container, CATEGORY_SELECTORS)
+    product['category'] = category or "General"
+    
+    # Add timestamp
+    product['launched_at'] = launched_at
+    
+    return product
+
+
+def _find_text_by_selectors(container, selectors: Tuple[str, ...]) -> Optional[str]:
+    """Find text content using multiple CSS selectors.
+    
+    Gives the same result as trying each selector's first match in
+    order, but walks the container once with the union of the selectors.
+    
+    Args:
+        container: BeautifulSoup element to search in
+        selectors: CSS selectors to try, in order of priority
+        
+    Returns:
+        First matching text content or None
+    """
+    union, patterns = _compile_selector_group(selectors)
+    
+    # First match of each selector, by priority rank; ranks below
+    # next_rank are settled and had no text
+    first_matches = {}
+    next_rank = 0
+    for element in union.select(container):
+        for rank in range(next_rank, len(patterns)):
+            if rank not in first_matches and patterns[rank].match(element):
+                first_matches[rank] = element
+        
+        # Return as soon as the best remaining selector has text; later
+        # elements can only be first matches of lower-priority selectors
+        while next_rank in first_matches:
+            text = first_matches[next_rank].get_text(strip=True)
+            if text:
+                return text
+            next_rank += 1
+    
+    for rank in range(next_rank, len(patterns)):
+        if rank in first_matches:
+            text = first_matches[rank].get_text(strip=True)
+            if text:
+                return text
+    return None
+
+
+def _extract_number(text: str) -> int:
+    """Extract the first number from a text string.
+    
+    Args:
+        text: Text that may contain numbers
+        
+    Returns:
+        First number found or 0
+    """
+    if not text:
+        return 0
+    
+    match = _DIGITS_RE.search(text.replace(',', ''))
+    return int(match.group()) if match else 0
+
+
+def _get_mock_products() -> List[Dict]:
+    """Get realistic mock product data for development/testing.
+    
+    Note: ProductHunt uses JavaScript-heavy rendering, making scraping complex.
+    This provides realistic data for MVP development and AI analysis testing.
+    
+    Returns:
+        List of mock product dictionaries based on real ProductHunt patterns
+    """
+    launched_at = datetime.now().isoformat()
+    randint = random.randint
+    
+    products = [
+        {
+            "name": name,
+            "tagline": tagline,
+            "votes": randint(*votes),
+            "comments": randint(*comments),
+            "url": url,
+            "maker": maker,
+            "category": category,
+            "launched_at": launched_at
+        }
+        for name, tagline, votes, comments, maker, category, url in _MOCK_TEMPLATE
+    ]
+        
+    # Add a note about this being mock data
+    logger.info("Using realistic mock data for development - ProductHunt requires JavaScript rendering")
+    
+    return products
+
 
 class ProductHuntScraper:
     """Scraper for ProductHunt daily products."""
     
-    def __init__(self, delay: float = 1.0, max_retries: int = 3):
+    def __init__(self, delay: float = 1.0, max_retries: int = 3,
+                 max_concurrency: int = MAX_CONCURRENT_REQUESTS):
         """Initialize the scraper with rate limiting settings.
         
         Args:
             delay: Delay between requests in seconds
             max_retries: Maximum number of retries for failed requests
+            max_concurrency: Maximum number of dates scraped at once by scrape_many
         """
         self.delay = delay
         self.max_retries = max_retries
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ProductHunt Daily Recap CLI Tool v1.0',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        self.max_concurrency = max_concurrency
+        # Pooled keep-alive session with an on-disk cache; failed requests
+        # and 429/5xx responses are retried by the adapter with
+        # exponential backoff, honouring Retry-After
+        self.session = create_session(
+            DEFAULT_HEADERS,
+            pool_size=32,
+            max_retries=max_retries,
+            backoff_factor=delay,
+            cache_name=HTTP_CACHE_NAME,
+            expire_after=CACHE_EXPIRE_AFTER,
+            urls_expire_after=URLS_EXPIRE_AFTER
+        )
         # Handle SSL issues in corporate environments
         self.session.verify = False
     
+    def __enter__(self) -> 'ProductHuntScraper':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections (and the response cache)."""
+        self.session.close()
+    
     def scrape_daily_products(self, date: str = None) -> List[Dict]:
         """Scrape products for a specific date.
         
@@ -51,17 +555,13 @@ class ProductHuntScraper:
         Returns:
             List of product dictionaries
         """
+        # Read the clock once so the default date and the front page check agree
+        today = datetime.now().date().isoformat()
         if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = today
         
         logger.info(f"Scraping ProductHunt for date: {date}")
-        
-        # For today's date, use the main page
-        if date == datetime.now().strftime('%Y-%m-%d'):
-            url = "https://www.producthunt.com/"
-        else:
-            # For historical dates, use time-travel URL
-            url = f"https://www.producthunt.com/time-travel/{date}"
+        url = self._date_url(date, today)
         
         try:
             products = self._fetch_products_from_url(url)
@@ -73,314 +573,178 @@ class ProductHuntScraper:
             # Return empty list instead of raising to allow graceful continuation
             return []
     
-    def _fetch_products_from_url(self, url: str) -> List[Dict]:
-        """Fetch and parse products from a URL.
+    async def scrape_daily_products_async(self, date: str, session: aiohttp.ClientSession,
+                                          parse_pool: Optional[Executor] = None,
+                                          today: Optional[str] = None,
+                                          limiter: Optional[AsyncLimiter] = None) -> List[Dict]:
+        """Scrape products for a specific date without blocking the event loop.
         
         Args:
-            url: ProductHunt URL to scrape
+            date: Date in YYYY-MM-DD format
+            session: aiohttp session shared by concurrent scrapes
+            parse_pool: Executor parsing the page; the loop's default
+                thread pool when None
+            today: Today's date in YYYY-MM-DD format; read from the clock
+                when None
+            limiter: Rate limiter every request waits on, if any
             
         Returns:
-            List of parsed product data
+            List of product dictionaries
         """
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(f"Fetching URL: {url} (attempt {attempt + 1})")
-                
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                # Parse HTML content
-                soup = BeautifulSoup(response.content, 'html.parser')
-                products = self._parse_products(soup)
-                
-                return products
-                
-            except requests.RequestException as e:
-                logger.warning(f"Request failed (attempt {attempt + 1}): {str(e)}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.delay * (2 ** attempt))  # Exponential backoff
-                else:
-                    raise
+        logger.info(f"Scraping ProductHunt for date: {date}")
+        url = self._date_url(date, today)
+        
+        try:
+            products = await self._fetch_products_from_url_async(url, session, parse_pool, limiter)
+            logger.info(f"Successfully scraped {len(products)} products for {date}")
+            return products
             
-            finally:
-                # Always respect rate limiting
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.delay)
+        except Exception as e:
+            logger.error(f"Failed to scrape products for {date}: {str(e)}")
+            return []
     
-    def _parse_products(self, soup: BeautifulSoup) -> List[Dict]:
-        """Parse products from BeautifulSoup object.
+    def scrape_range(self, dates: List[str]) -> Dict[str, List[Dict]]:
+        """Scrape products for several dates concurrently.
+        
+        Synchronous entry point running scrape_many on a new event loop.
         
         Args:
-            soup: BeautifulSoup parsed HTML
+            dates: Dates in YYYY-MM-DD format
             
         Returns:
-            List of product dictionaries
+            Dictionary mapping each date to its list of product dictionaries
         """
-        products = []
-        
-        try:
-            # Look for product containers using common selectors
-            # ProductHunt uses data-test attributes and specific CSS classes
-            product_containers = soup.find_all(['div', 'article'], attrs={
-                'data-test': lambda x: x and 'post-item' in x if x else False
-            })
-            
-            if not product_containers:
-                # Fallback: Look for common product card patterns
-                product_containers = soup.find_all('div', class_=lambda x: x and any(
-                    term in x.lower() for term in ['product', 'post', 'item'] if x
-                ))
-            
-            logger.info(f"Found {len(product_containers)} potential product containers")
-            
-            for i, container in enumerate(product_containers[:20]):  # Limit to 20 products max
-                try:
-                    product = self._extract_product_data(container, i)
-                    if product and product.get('name') and not product['name'].startswith('Product '):
-                        # Only add if we got valid, non-generic data
-                        products.append(product)
-                except Exception as e:
-                    logger.warning(f"Failed to parse product {i}: {str(e)}")
-                    continue
-            
-            # If we couldn't parse any meaningful products, return realistic mock data
-            if not products:
-                logger.warning("No meaningful products extracted - using realistic mock data for development")
-                products = self._get_mock_products()
-            
-        except Exception as e:
-            logger.error(f"Error parsing products: {str(e)}")
-            products = self._get_mock_products()
-        
-        return products
+        return asyncio.run(self.scrape_many(dates))
     
-    def _extract_product_data(self, container, index: int) -> Dict:
-        """Extract product data from a container element.
+    async def scrape_many(self, dates: List[str]) -> Dict[str, List[Dict]]:
+        """Scrape products for several dates on one aiohttp session.
+        
+        Pages are fetched concurrently, at most max_concurrency at a time
+        and starting at most one request per delay seconds, over a shared
+        keep-alive connection pool; failed fetches back off exponentially
+        before retrying. When there are several pages, they are parsed
+        across CPU cores in a process pool.
         
         Args:
-            container: BeautifulSoup element containing product data
-            index: Product index for fallback naming
+            dates: Dates in YYYY-MM-DD format
             
         Returns:
-            Dictionary with product data
+            Dictionary mapping each date to its list of product dictionaries;
+            a date whose scrape fails maps to an empty list
         """
-        product = {}
-        
-        # Extract product name
-        name_selectors = [
-            'h3', 'h2', '[data-test*="name"]', '.name', '.title',
-            'a[href*="/posts/"]', '[class*="name"]', '[class*="title"]'
-        ]
-        
-        name = self._find_text_by_selectors(container, name_selectors)
-        product['name'] = name or f"Product {index + 1}"
-        
-        # Extract tagline/description
-        tagline_selectors = [
-            '.tagline', '.description', '[data-test*="tagline"]',
-            'p', '.subtitle', '[class*="tagline"]', '[class*="description"]'
-        ]
-        
-        tagline = self._find_text_by_selectors(container, tagline_selectors)
-        product['tagline'] = tagline or "No description available"
-        
-        # Extract votes (look for numbers)
-        votes_selectors = [
-            '[data-test*="vote"]', '.votes', '.vote-count', '.upvote',
-            '[class*="vote"]', '[class*="count"]'
-        ]
-        
-        votes_text = self._find_text_by_selectors(container, votes_selectors)
-        votes = self._extract_number(votes_text) if votes_text else 0
-        product['votes'] = votes
-        
-        # Extract comments count
-        comments_selectors = [
-            '[data-test*="comment"]', '.comments', '.comment-count',
-            '[class*="comment"]', '[href*="comments"]'
-        ]
-        
-        comments_text = self._find_text_by_selectors(container, comments_selectors)
-        comments = self._extract_number(comments_text) if comments_text else 0
-        product['comments'] = comments
-        
-        # Extract product URL
-        url_element = container.find('a', href=lambda x: x and '/posts/' in x if x else False)
-        if url_element and url_element.get('href'):
-            href = url_element['href']
-            product['url'] = href if href.startswith('http') else f"https://www.producthunt.com{href}"
-        else:
-            product['url'] = f"https://www.producthunt.com/posts/product-{index + 1}"
-        
-        # Extract maker name
-        maker_selectors = [
-            '[data-test*="maker"]', '.maker', '.author', '.creator',
-            '[class*="maker"]', '[class*="author"]'
-        ]
-        
-        maker = self._find_text_by_selectors(container, maker_selectors)
-        product['maker'] = maker or "Unknown Maker"
-        
-        # Extract category (often harder to find)
-        category_selectors = [
-            '.category', '.tag', '[data-test*="category"]',
-            '[class*="category"]', '[class*="tag"]'
-        ]
-        
-        category = self._find_text_by_selectors(container, category_selectors)
-        product['category'] = category or "General"
-        
-        # Add timestamp
-        product['launched_at'] = datetime.now().isoformat()
-        
-        return product
-    
-    def _find_text_by_selectors(self, container, selectors: List[str]) -> Optional[str]:
-        """Find text content using multiple CSS selectors.
+        sem = asyncio.Semaphore(self.max_concurrency)
+        # Requests still overlap, but start no faster than one per delay
+        limiter = AsyncLimiter(1, self.delay) if self.delay > 0 else None
+        # One notion of today for the whole batch, even across midnight
+        today = datetime.now().date().isoformat()
+        
+        async def scrape(date: str) -> List[Dict]:
+            async with sem:
+                return await self.scrape_daily_products_async(date, session, parse_pool, today, limiter)
+        
+        # Certificate checks are disabled as for the requests session
+        connector = aiohttp.TCPConnector(
+            limit=CONNECTOR_LIMIT,
+            limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            ssl=False
+        )
+        # No more parse workers than pages; a single page is parsed on the
+        # loop's default thread pool rather than forking a worker for it
+        workers = min(os.cpu_count() or 1, len(dates))
+        parse_pool_context = ProcessPoolExecutor(max_workers=workers) if workers > 1 else contextlib.nullcontext()
+        with parse_pool_context as parse_pool:
+            async with create_async_session(DEFAULT_HEADERS, ASYNC_HTTP_CACHE_NAME,
+                                            urls_expire_after=ASYNC_URLS_EXPIRE_AFTER,
+                                            connector=connector) as session:
+                results = await asyncio.gather(*(scrape(date) for date in dates), return_exceptions=True)
+        
+        products_by_date = {}
+        for date, result in zip(dates, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to scrape products for {date}: {str(result)}")
+                result = []
+            products_by_date[date] = result
+        return products_by_date
+    
+    def _date_url(self, date: str, today: Optional[str] = None) -> str:
+        """Get the ProductHunt URL listing the products of a date.
         
         Args:
-            container: BeautifulSoup element to search in
-            selectors: List of CSS selectors to try
+            date: Date in YYYY-MM-DD format
+            today: Today's date in YYYY-MM-DD format; read from the clock
+                when None
             
         Returns:
-            First matching text content or None
+            URL of the front page for today, of the time-travel page otherwise
         """
-        for selector in selectors:
-            try:
-                element = container.select_one(selector)
-                if element and element.get_text(strip=True):
-                    return element.get_text(strip=True)
-            except Exception:
-                continue
-        return None
+        if today is None:
+            today = datetime.now().date().isoformat()
+        # For today's date, use the main page
+        if date == today:
+            return FRONT_PAGE_URL
+        # For historical dates, use time-travel URL
+        return TIME_TRAVEL_URL.format(date)
     
-    def _extract_number(self, text: str) -> int:
-        """Extract the first number from a text string.
+    def _fetch_products_from_url(self, url: str) -> List[Dict]:
+        """Fetch and parse products from a URL.
         
         Args:
-            text: Text that may contain numbers
+            url: ProductHunt URL to scrape
             
         Returns:
-            First number found or 0
+            List of parsed product data
         """
-        if not text:
-            return 0
-            
-        import re
-        numbers = re.findall(r'\d+', text.replace(',', ''))
-        return int(numbers[0]) if numbers else 0
-    
-    def _get_mock_products(self) -> List[Dict]:
-        """Get realistic mock product data for development/testing.
+        logger.debug(f"Fetching URL: {url}")
         
-        Note: ProductHunt uses JavaScript-heavy rendering, making scraping complex.
-        This provides realistic data for MVP development and AI analysis testing.
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
         
+        return _parse_html(response.content)
+    
+    async def _fetch_products_from_url_async(self, url: str, session: aiohttp.ClientSession,
+                                             parse_pool: Optional[Executor] = None,
+                                             limiter: Optional[AsyncLimiter] = None) -> List[Dict]:
+        """Fetch and parse products from a URL with aiohttp.
+        
+        Args:
+            url: ProductHunt URL to scrape
+            session: aiohttp session to fetch with
+            parse_pool: Executor parsing the page; the loop's default
+                thread pool when None
+            limiter: Rate limiter every attempt waits on, if any
+            
         Returns:
-            List of mock product dictionaries based on real ProductHunt patterns
+            List of parsed product data
         """
-        import random
-        
-        # Realistic product names and taglines based on common ProductHunt patterns
-        mock_data = [
-            {
-                "name": "AI Productivity Suite",
-                "tagline": "Boost your workflow with intelligent automation and smart insights",
-                "votes": random.randint(50, 300),
-                "comments": random.randint(5, 45),
-                "maker": "ProductivityAI",
-                "category": "Productivity"
-            },
-            {
-                "name": "CodeReview AI",
-                "tagline": "Automated code reviews with AI-powered suggestions and security checks",
-                "votes": random.randint(80, 250),
-                "comments": random.randint(10, 35),
-                "maker": "DevTools Pro",
-                "category": "Developer Tools"
-            },
-            {
-                "name": "StartupMetrics Dashboard",
-                "tagline": "Track KPIs, revenue, and growth metrics in one beautiful dashboard",
-                "votes": random.randint(120, 280),
-                "comments": random.randint(15, 40),
-                "maker": "MetricsLab",
-                "category": "Analytics"
-            },
-            {
-                "name": "AI Content Generator",
-                "tagline": "Create engaging content for social media, blogs, and marketing campaigns",
-                "votes": random.randint(90, 220),
-                "comments": random.randint(8, 30),
-                "maker": "ContentAI",
-                "category": "Marketing"
-            },
-            {
-                "name": "Remote Team Sync",
-                "tagline": "Keep distributed teams aligned with smart scheduling and collaboration tools",
-                "votes": random.randint(60, 180),
-                "comments": random.randint(12, 25),
-                "maker": "RemoteFirst",
-                "category": "Collaboration"
-            },
-            {
-                "name": "Customer Feedback AI",
-                "tagline": "Analyze customer sentiment and extract actionable insights from reviews",
-                "votes": random.randint(70, 200),
-                "comments": random.randint(7, 28),
-                "maker": "FeedbackLabs",
-                "category": "Customer Success"
-            },
-            {
-                "name": "Expense Tracker Pro",
-                "tagline": "Smart expense tracking with receipt scanning and budget forecasting",
-                "votes": random.randint(85, 160),
-                "comments": random.randint(9, 22),
-                "maker": "FinanceTools",
-                "category": "Finance"
-            },
-            {
-                "name": "Design System Builder",
-                "tagline": "Create and maintain consistent design systems across your product team",
-                "votes": random.randint(95, 240),
-                "comments": random.randint(11, 33),
-                "maker": "DesignOps",
-                "category": "Design Tools"
-            },
-            {
-                "name": "API Security Scanner",
-                "tagline": "Automated vulnerability scanning and security testing for REST APIs",
-                "votes": random.randint(110, 190),
-                "comments": random.randint(13, 27),
-                "maker": "SecureAPI",
-                "category": "Security"
-            },
-            {
-                "name": "Social Media Scheduler",
-                "tagline": "Plan, schedule, and analyze your social media presence across all platforms",
-                "votes": random.randint(75, 210),
-                "comments": random.randint(6, 31),
-                "maker": "SocialGrowth",
-                "category": "Social Media"
-            }
-        ]
-        
-        # Convert to full product format
-        products = []
-        for i, data in enumerate(mock_data):
-            product = {
-                "name": data["name"],
-                "tagline": data["tagline"],
-                "votes": data["votes"],
-                "comments": data["comments"],
-                "url": f"https://producthunt.com/posts/{data['name'].lower().replace(' ', '-')}",
-                "maker": data["maker"],
-                "category": data["category"],
-                "launched_at": datetime.now().isoformat()
-            }
-            products.append(product)
+        # Same policy as the sync session's urllib3 Retry: one attempt plus
+        # max_retries retries, of rate limiting and transient server errors
+        # only, after the server's Retry-After delay when it gives one
+        for attempt in range(self.max_retries + 1):
+            try:
+                if limiter is not None:
+                    await limiter.acquire()
+                logger.debug(f"Fetching URL: {url} (attempt {attempt + 1})")
+                
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+                
+                # Parse in a worker so other fetches keep running
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(parse_pool, _parse_html, content)
+                
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    raise
+                retry_after = e.headers.get('Retry-After') if e.headers else None
+                delay = retry_after_seconds(retry_after, default=self.delay * (2 ** attempt))
+                logger.warning(f"Request failed (attempt {attempt + 1}): {str(e)}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
             
-        # Add a note about this being mock data
-        logger.info("Using realistic mock data for development - ProductHunt requires JavaScript rendering")
-        
-        return products
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Request failed (attempt {attempt + 1}): {str(e)}")
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.delay * (2 ** attempt))  # Exponential backoff
+                else:
+                    raise
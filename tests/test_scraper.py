@@ -0,0 +1,137 @@
+"""
+Tests for the ProductHunt scraper: page parsing and the async fetch path.
+"""
+
+import asyncio
+import sys
+from typing import Dict, Optional
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import scraper as scraper_module  # noqa: E402
+from scraper import ProductHuntScraper, _parse_html  # noqa: E402
+
+PAGE = b'''<html><body>
+<div data-test="post-item-0">
+  <a href="/posts/prod-0"><h3>Prod 0</h3></a>
+  <p class="tagline">Tagline 0</p>
+  <button data-test="vote-button"><span>42</span></button>
+</div>
+</body></html>'''
+
+# Page without post-item cards, only generic product-classed cards
+FALLBACK_PAGE = b'''<html><body>
+<nav><a href="/posts/not-a-card">Nav link</a></nav>
+<div class="ProductCard">
+  <a href="/posts/card-0"><h3>Card 0</h3></a>
+  <p class="tagline">Card tagline 0</p>
+  <span class="vote-count">1,234</span>
+</div>
+<div class="ProductCard">
+  <a href="/posts/card-1"><h3>Card 1</h3></a>
+  <span class="vote-count">7</span>
+</div>
+</body></html>'''
+
+
+def test_parse_html_reads_post_item_cards():
+    products = _parse_html(PAGE)
+    
+    assert [(p['name'], p['tagline'], p['votes'], p['url']) for p in products] == [
+        ('Prod 0', 'Tagline 0', 42, 'https://www.producthunt.com/posts/prod-0'),
+    ]
+
+
+def test_parse_html_falls_back_to_product_classed_cards():
+    products = _parse_html(FALLBACK_PAGE)
+    
+    assert [(p['name'], p['votes'], p['url']) for p in products] == [
+        ('Card 0', 1234, 'https://www.producthunt.com/posts/card-0'),
+        ('Card 1', 7, 'https://www.producthunt.com/posts/card-1'),
+    ]
+
+
+def _scrape(max_retries, failures, dates, status=503, headers: Optional[Dict[str, str]] = None):
+    """Scrape dates from a local server whose pages fail `failures` times first.
+    
+    Failed requests get the given status and headers.
+    
+    Returns:
+        Tuple of (products by date, requests received per path)
+    """
+    hits = {}
+    
+    async def page(request):
+        hits[request.path] = hits.get(request.path, 0) + 1
+        if hits[request.path] <= failures:
+            return web.Response(status=status, headers=headers)
+        return web.Response(body=PAGE, content_type='text/html')
+    
+    async def run():
+        app = web.Application()
+        app.router.add_get('/{date}', page)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        
+        scraper = ProductHuntScraper(delay=0, max_retries=max_retries)
+        scraper._date_url = lambda date, today=None: f'http://127.0.0.1:{port}/{date}'
+        try:
+            return await scraper.scrape_many(dates)
+        finally:
+            scraper.close()
+            await runner.cleanup()
+    
+    return asyncio.run(run()), hits
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    # The scrapers keep their HTTP cache under the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def test_scrape_many_without_retries_still_fetches():
+    products_by_date, hits = _scrape(max_retries=0, failures=0, dates=['d1', 'd2'])
+    
+    assert [p['name'] for p in products_by_date['d1']] == ['Prod 0']
+    assert [p['name'] for p in products_by_date['d2']] == ['Prod 0']
+    assert hits == {'/d1': 1, '/d2': 1}
+
+
+def test_scrape_many_without_retries_gives_up_after_one_attempt():
+    products_by_date, hits = _scrape(max_retries=0, failures=1, dates=['d1'])
+    
+    assert products_by_date == {'d1': []}
+    assert hits == {'/d1': 1}
+
+
+def test_scrape_many_retries_transient_errors():
+    products_by_date, hits = _scrape(max_retries=2, failures=2, dates=['d1'])
+    
+    assert [p['name'] for p in products_by_date['d1']] == ['Prod 0']
+    assert hits == {'/d1': 3}
+
+
+def test_scrape_many_waits_for_retry_after(monkeypatch):
+    delays = []
+    real_sleep = asyncio.sleep
+    
+    async def fake_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await real_sleep(0)
+    
+    monkeypatch.setattr(scraper_module.asyncio, 'sleep', fake_sleep)
+    products_by_date, hits = _scrape(max_retries=1, failures=1, dates=['d1'],
+                                     status=429, headers={'Retry-After': '7'})
+    
+    assert [p['name'] for p in products_by_date['d1']] == ['Prod 0']
+    assert hits == {'/d1': 2}
+    # The server's delay wins over the (zero) exponential backoff
+    assert 7.0 in delays